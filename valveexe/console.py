@@ -1,9 +1,10 @@
 import os
 import time
-import subprocess
 
 from rcon import Client
 
+from valveexe.utils import launch_detached
+
 
 class VConsole():
     '''An abstract definition for the different types of console
@@ -11,6 +12,8 @@ class VConsole():
     commands via the :any:`run` function
     '''
 
+    __slots__ = ()
+
     def run(self, command, *params):
         '''Runs a specified command with it's parameters
 
@@ -22,6 +25,22 @@ class VConsole():
         '''
         pass
 
+    def run_many(self, *commands):
+        '''Runs several commands at once by chaining them with ``;``,
+        the way the Source Engine console would.
+
+        :param \*commands: The commands to run, either as a str or as a \
+        tuple of a command followed by its parameters.
+        :type \*commands: str, tuple
+        '''
+        commands = [command for command in commands if command]
+        if not commands:
+            return
+        self.run(';'.join(
+            command if isinstance(command, str) else
+            ' '.join([command[0], *map(str, command[1:])])
+            for command in commands))
+
     def __enter__(self):
         pass
 
@@ -35,6 +54,8 @@ class RconConsole(VConsole):
     This is supported by most multiplayer games.
     '''
 
+    __slots__ = ('client',)
+
     def __init__(self, ip, port, passwd):
         '''
         :param ip: The IP the game client is listening on (usually "127.0.0.1").
@@ -61,6 +82,9 @@ class ExecConsole(VConsole):
     This is supported by games that support -hijack (not csgo).
     '''
 
+    __slots__ = ('gameExe', 'gameDir', 'cfgName', 'cfgPath', 'launchParams',
+                 'process')
+
     def __init__(self, gameExe, gameDir, uuid):
         '''
         :param gameExe: The path to the game executable.
@@ -74,6 +98,7 @@ class ExecConsole(VConsole):
         self.gameDir = gameDir
         self.cfgName = 'valve-exe-' + uuid + '.cfg'
         self.cfgPath = os.path.join(self.gameDir, 'cfg', self.cfgName)
+        self.launchParams = [self.gameExe, '-hijack', '+exec', self.cfgName]
 
     def run(self, command, *params):
         with open(self.cfgPath, "w") as f:
@@ -81,11 +106,7 @@ class ExecConsole(VConsole):
             f.write(command + ' ' + ' '.join(params))
             f.truncate()
 
-        launch_params = [self.gameExe, '-hijack', '+exec', self.cfgName]
-        self.process = subprocess.Popen(
-            launch_params,
-            creationflags=subprocess.DETACHED_PROCESS |
-            subprocess.CREATE_NEW_PROCESS_GROUP)
+        self.process = launch_detached(self.launchParams)
 
         time.sleep(1) # leaves time for the game to read the command
 
@@ -1,16 +1,15 @@
 import os
 import uuid
 import time
-import subprocess
 import psutil
-import glob
 
-from rcon import Client
-
-from valveexe.utils import find_process, terminate_process
+from valveexe.utils import find_process, terminate_process, launch_detached
 from valveexe.logger import Logger
 from valveexe.console import RconConsole, ExecConsole
 
+# seconds between checks while waiting on the game client
+_POLL_INTERVAL = 0.25
+
 
 class ValveExe(object):
     def __init__(self, gameExe, gameDir, steamExe=None, appid=None):
@@ -36,6 +35,7 @@ class ValveExe(object):
         self.gameExe = gameExe
         self.gameDir = gameDir
         self.exeName = self.gameExe.split('\\')[-1]
+        self.modName = self.gameDir.split('\\')[-1]
 
         self.appid = appid
         self.steamExe = steamExe
@@ -46,10 +46,17 @@ class ValveExe(object):
         self.logPath = os.path.join(gameDir, self.logName)
 
         self.console = None
+        self._ownsConsole = False  # opened by run() rather than a with block
+        self.process = None
+        self.logger = None
 
         self.rcon_enabled = None
         self.hijacked = None
 
+        # a process' cmdline cannot change, it is only fetched once per process
+        self._cmdlineProcess = None
+        self._cmdline = None
+
         self._full_cleanup()
 
     def launch(self, *params):
@@ -59,6 +66,8 @@ class ValveExe(object):
         :param \*params: The launch parameters to be supplied to the executable.
         :type \*params: str
         '''
+        self._release_console()  # it belongs to the previous game client
+
         if self.steamExe and self.appid:
             # Steam launches cannot be hijacked
             terminate_process(self.exeName)
@@ -75,14 +84,11 @@ class ValveExe(object):
             launch_params.extend(['-usercon', '+ip', '0.0.0.0',
                                   '+rcon_password', self.uuid])
 
-        launch_params.extend(list(*params))
-        self.process = subprocess.Popen(
-            launch_params,
-            creationflags=subprocess.DETACHED_PROCESS |
-            subprocess.CREATE_NEW_PROCESS_GROUP)
+        launch_params.extend(params)
+        self.process = launch_detached(launch_params)
 
         while not os.path.exists(self.logPath):
-            time.sleep(3)
+            time.sleep(_POLL_INTERVAL)
 
         self.logger = Logger(self.logPath)
 
@@ -95,16 +101,21 @@ class ValveExe(object):
         :param \*params: The values to be included with the command.
         :type \*params: str
         '''
-        if not self.process:
-            return
-        if self.console:
-            self.console.run(command, *params)
-        else:
-            with self as console:
-                console.run(command, *params)
+        self._use_console(lambda console: console.run(command, *params))
+
+    def run_many(self, *commands):
+        '''Forwards several commands to the active :any:`VConsole` at once,
+        see :any:`VConsole.run_many`.
+
+        :param \*commands: The commands to run, either as a str or as a \
+        tuple of a command followed by its parameters.
+        :type \*commands: str, tuple
+        '''
+        self._use_console(lambda console: console.run_many(*commands))
 
     def quit(self):
         '''Closes the game client'''
+        self._release_console()
         process = self.process or find_process(self.exeName)
         if process:
             process.terminate()
@@ -120,44 +131,95 @@ class ValveExe(object):
         if not process:
             # no process running
             return None
-        elif self.gameDir not in process.cmdline() and \
-                self.gameDir.split('\\')[-1] not in process.cmdline():
+
+        if process != self._cmdlineProcess:
+            self._cmdlineProcess = process
+            self._cmdline = process.cmdline()
+        cmdline = self._cmdline
+
+        if self.gameDir not in cmdline and self.modName not in cmdline:
             # wrong game
             process.terminate()
             return None
-        elif '-usercon' not in process.cmdline():
+        elif '-usercon' not in cmdline:
             # doesn't have rcon enabled
             return False
         else:
             # 'connections' confirms game is listening for rcon
-            return bool(process.connections())
+            return bool(process.connections(kind='tcp'))
+
+    def _use_console(self, use):
+        '''Calls use() with the active console, opening one if needed.
+        An RCON console opened here is kept for the following commands
+        until :any:`quit`, any other is closed right after.'''
+        if not self.process:
+            return
+        if not self.console:
+            self.__enter__()
+            self._ownsConsole = True
+
+        try:
+            use(self.console)
+        except:
+            self._release_console()  # reconnect on the next command
+            raise
+
+        if not isinstance(self.console, RconConsole):
+            # RCON may not have been up yet, check again on the next command
+            self._release_console()
+
+    def _release_console(self):
+        '''Closes the console if it was opened by :any:`run`'''
+        if self._ownsConsole:
+            self.__exit__(None, None, None)
 
     def __enter__(self):
-        while self._check_rcon_eligible() is None:
-            time.sleep(3)
+        if self.console:
+            # reuse the console opened by run(), the with block now owns it
+            self._ownsConsole = False
+            return self.console
+
+        rcon_eligible = self._check_rcon_eligible()
+        while rcon_eligible is None:
+            time.sleep(_POLL_INTERVAL)
+            rcon_eligible = self._check_rcon_eligible()
 
-        if self._check_rcon_eligible():
+        if rcon_eligible:
             self.console = RconConsole("127.0.0.1", 27015, self.uuid)
         else:
             self.console = ExecConsole(self.gameExe, self.gameDir, self.uuid)
 
-        self.console.__enter__()
+        try:
+            self.console.__enter__()
+        except:
+            self.console = None  # never connected, nothing to close
+            raise
         return self.console
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.console.__exit__(exc_type, exc_val, exc_tb)
         self.console = None
+        self._ownsConsole = False
 
     def __del__(self):
         try:
             self.run('con_logfile', '""')
         except:
             pass
+        finally:
+            self._release_console()
         del self.logger
 
     def _full_cleanup(self):
-        for f in glob.glob(self.gameDir + 'valve-exe-*.log'):
-            try:
-                os.remove(f)
-            except:
-                pass
+        try:
+            entries = os.scandir(self.gameDir)
+        except OSError:
+            return  # nothing to clean up in a missing or unreadable folder
+        with entries:
+            for entry in entries:
+                if entry.name.startswith('valve-exe-') and \
+                        entry.name.endswith('.log'):
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
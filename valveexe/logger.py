@@ -1,6 +1,12 @@
 import os
 import re
 import time
+import io
+import codecs
+import threading
+
+# characters that give a regex string a meaning beyond its literal text
+_REGEX_SPECIAL = re.compile(r'[\\.^$*+?{}\[\]|()]')
 
 
 class Logger():
@@ -8,15 +14,40 @@ class Logger():
     Supported in most source games (except l4d2)
     '''
 
-    def __init__(self, logpath):
+    __slots__ = ('logPath', 'keepLogs', 'minInterval', 'maxInterval',
+                 '_logBytes', '_logs', '_logsStale', '_bookmark', '_file',
+                 '_lock', '_decoder')
+
+    def __init__(self, logpath, keepLogs=True, minInterval=0.1,
+                 maxInterval=2.0):
         '''
         :param logpath: The path to the log file
         :type logpath: path, str
+        :param keepLogs: Whether to accumulate all ingested logs in \
+        :any:`logs`. Long sessions may want to turn this off.
+        :type keepLogs: optional, bool
+        :param minInterval: Seconds between reads of the log file by \
+        :any:`log_until` while the game is writing to it.
+        :type minInterval: optional, float
+        :param maxInterval: Seconds between reads that :any:`log_until` \
+        gradually backs off to while the log stays quiet.
+        :type maxInterval: optional, float
          '''
         self.logPath = logpath
+        self.keepLogs = keepLogs
+        self.minInterval = minInterval
+        self.maxInterval = maxInterval
 
-        self.logs = ''  #: :type: (str) - all the logs accumulated so far
+        self._logBytes = bytearray()  # only decoded when logs are read
+        self._logs = ''
+        self._logsStale = False
         self._bookmark = 0
+        self._file = None  # opened on the first ingest, the log may not exist yet
+        self._lock = threading.Lock()  # ingests may come from several threads
+        # decodes like text mode would, keeping multi-byte characters and
+        # line endings that are split across two reads intact
+        self._decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder('utf-8')('replace'), translate=True)
 
     def log_ingest(self):
         '''
@@ -25,35 +56,99 @@ class Logger():
 
         :rtype: str
         '''
-        logs_since_bookmark = ''
-        with open(self.logPath, mode='r') as f:
-            f.seek(self._bookmark, 0)
-            for line in f.readlines():
-                self.logs += line
-                logs_since_bookmark += line
-                self._bookmark = f.tell()
+        with self._lock:
+            if not self._file:
+                # unbuffered, every read wants all that's new in one go
+                self._file = open(self.logPath, mode='rb', buffering=0)
+            size = os.fstat(self._file.fileno()).st_size
+            if size < self._bookmark:
+                # the log was truncated, read it again from the start
+                self._bookmark = 0
+                self._decoder.reset()
+            if size == self._bookmark:
+                return ''  # the game hasn't written anything since
+
+            if hasattr(os, 'pread'):
+                data = os.pread(self._file.fileno(), size - self._bookmark,
+                                self._bookmark)
+            else:
+                self._file.seek(self._bookmark, 0)
+                data = self._file.read()
+            self._bookmark += len(data)
+            logs_since_bookmark = self._decoder.decode(data)
+            if self.keepLogs:
+                self._logBytes += data
+                self._logsStale = True
         return logs_since_bookmark
 
-    def log_until(self, until=None):
+    @property
+    def logs(self):
+        '''All the logs accumulated so far
+
+        :rtype: str
+        '''
+        with self._lock:
+            if self._logsStale:
+                self._logs = self._logBytes.decode('utf-8', 'replace') \
+                    .replace('\r\n', '\n').replace('\r', '\n')
+                self._logsStale = False
+            return self._logs
+
+    def log_until(self, until=None, prefilter=None):
         '''
         Will :any:`log_ingest()<log_ingest>` until a specified regex is
         found within the logs and returns the logs until that point.
 
-        :param until: A regex string to match against the logs
-        :type until: str
+        :param until: A regex string to match against the logs. A pattern \
+        already compiled with :any:`re.compile` is used as is, which is \
+        cheaper for patterns waited on repeatedly. Patterns compiled by \
+        other engines sharing the `re` API, such as `google-re2 \
+        <https://pypi.org/project/google-re2/>`_, are used as is too.
+        :type until: str, re.Pattern
+        :param prefilter: A plain substring that any match of :any:`until` \
+        must contain. The regex is only run once it appears in the logs. \
+        Defaults to :any:`until` itself when it contains no special characters.
+        :type prefilter: optional, str
         :rtype: str
         '''
         logs_since_until = ''  # all logs since the previous log_until()
-        with open(self.logPath, mode='r') as f:
+        pattern = until or None
+        if pattern and not hasattr(pattern, 'search'):
+            pattern = re.compile(pattern)
+        if prefilter is None and isinstance(until, str) and \
+                until and not _REGEX_SPECIAL.search(until):
+            prefilter = until
 
-            while not re.search(until, logs_since_until):
-                time.sleep(0.5)
-                logs_since_until += self.log_ingest()
-                if not until:
-                    break
+        interval = self.minInterval
+        matched = pattern and self._matches(pattern, prefilter, '')
+        while not matched:
+            new_logs = self.log_ingest()
+            logs_since_until += new_logs
+            if not pattern:
+                break
+            if new_logs:  # nothing new means nothing new to match
+                matched = self._matches(pattern, prefilter, logs_since_until)
+                interval = self.minInterval
+            if not matched:
+                time.sleep(interval)
+                interval = min(interval * 1.5, self.maxInterval)
         return logs_since_until
 
+    @staticmethod
+    def _matches(pattern, prefilter, logs):
+        if prefilter and prefilter not in logs:
+            return False
+        return bool(pattern.search(logs))
+
+    def close(self):
+        '''Releases the handle kept on the log file'''
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
     def __del__(self):
+        self.close()
         try:
             os.remove(self.logPath)
         except:
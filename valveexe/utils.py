@@ -1,9 +1,30 @@
+import time
+import subprocess
 import psutil
 
+_found_processes = {}  # exe name: (last process found, when it was looked up)
+# seconds a failed lookup is trusted for, well under the 0.25s callers poll at
+_NOT_FOUND_TTL = 0.1
+
 def find_process(exeName):
-    return next((p for p in psutil.process_iter() if
-                p.name() == exeName), None)
+    process, found_at = _found_processes.get(exeName, (None, None))
+    if process and process.is_running():
+        return process  # is_running() also guards against a reused pid
+    if not process and found_at and \
+            time.monotonic() - found_at < _NOT_FOUND_TTL:
+        return None
+
+    process = next((p for p in psutil.process_iter(['name']) if
+                   p.info['name'] == exeName), None)
+    _found_processes[exeName] = (process, time.monotonic())
+    return process
 
 def terminate_process(exeName):
     process = find_process(exeName)
-    process and process.terminate()
\ No newline at end of file
+    process and process.terminate()
+
+def launch_detached(launch_params):
+    return subprocess.Popen(
+        launch_params,
+        creationflags=subprocess.DETACHED_PROCESS |
+        subprocess.CREATE_NEW_PROCESS_GROUP)